@@ -4,8 +4,8 @@
 
 # import the circular statistics module
 import circ
-# import the normalize function from the misc module
-from misc import normalize
+# import the normalize and logsumexp functions from the misc module
+from misc import normalize, logsumexp
 # create a random state for the stats package
 import numpy as np
 rand = np.random.RandomState(0)
@@ -16,4 +16,4 @@ import rvs
 # Specify which of these things are "officially" part of the stats
 # package.  These things must have previously been imported; i.e.,
 # they must exist in the current namespace.
-__all__ = ['circ', 'rvs', 'rand', 'normalize', 'other_stuff']
+__all__ = ['circ', 'rvs', 'rand', 'normalize', 'logsumexp', 'other_stuff']
@@ -0,0 +1,69 @@
+"""Helpers shared by the circ and misc modules for working through
+large arrays (including np.memmap arrays and .npy files) in blocks
+that fit in a memory budget.
+
+MEMORY_BUDGET is the single setting for both modules, and is read
+each time a block size is chosen, so it can be changed at any time:
+
+    >>> import stats._blocked
+    >>> stats._blocked.MEMORY_BUDGET = 2 ** 26
+
+"""
+
+import numpy as np
+
+# Approximate number of bytes of memory that a reduction may use at
+# once (per thread) for input data and temporaries.
+MEMORY_BUDGET = 2 ** 22
+
+
+def _blocksize(itemsize):
+    """Number of elements to process at once, given that each element
+    needs 'itemsize' bytes of input and temporaries.
+
+    """
+    return max(1, MEMORY_BUDGET // itemsize)
+
+
+def _blocks(shape, blocksize):
+    """Yield index tuples that split an array of the given shape into
+    blocks of at most 'blocksize' elements, by slicing its leading
+    axes.  For C-ordered arrays, each block is contiguous.
+
+    """
+    size = int(np.prod(shape))
+    if len(shape) == 0 or size <= blocksize:
+        yield ()
+        return
+    rowsize = size // shape[0]
+    if rowsize <= blocksize:
+        # several whole rows fit in one block
+        step = blocksize // rowsize
+        for start in range(0, shape[0], step):
+            yield (slice(start, start + step),)
+    else:
+        # a single row is too big, so split each row further
+        for i in range(shape[0]):
+            for index in _blocks(shape[1:], blocksize):
+                yield (i,) + index
+
+
+def _axes(ndim, axis):
+    """Turn an 'axis' argument into a tuple of non-negative axes."""
+    if axis is None:
+        return tuple(range(ndim))
+    if isinstance(axis, (tuple, list)):
+        return tuple(a % ndim for a in axis)
+    return (axis % ndim,)
+
+
+def _dtype(arr, dtype=None):
+    """Choose the floating point dtype to compute in.  Floating point
+    input keeps its own precision, anything else becomes float64.
+
+    """
+    if dtype is not None:
+        return np.dtype(dtype)
+    if np.issubdtype(arr.dtype, np.floating):
+        return arr.dtype
+    return np.dtype('f8')
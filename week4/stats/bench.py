@@ -0,0 +1,358 @@
+"""Benchmarks for the stats package.  Run as a script from this
+directory, optionally naming the benchmarks to run:
+
+    python bench.py describe
+
+"""
+
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import numpy as np
+
+import circ
+import misc
+from rvs import GaussianRV, GaussianRVArray, SufficientStats
+
+
+def timeit(func, *args, **kwargs):
+    """Return the best wall-clock time (in seconds) of three calls to
+    func(*args, **kwargs).
+
+    """
+    best = np.inf
+    for i in range(3):
+        start = time.time()
+        func(*args, **kwargs)
+        best = min(best, time.time() - start)
+    return best
+
+
+def peakmem(func, *args, **kwargs):
+    """Return the peak memory (in MB) allocated during a call to
+    func(*args, **kwargs), or nan if it cannot be measured.
+
+    """
+    if tracemalloc is None:
+        return np.nan
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak / 2. ** 20
+
+
+def report(name, t_old, t_new):
+    print("%-40s old: %8.4fs  new: %8.4fs  speedup: %5.1fx" % (
+        name, t_old, t_new, t_old / t_new))
+
+
+def bench_describe(n=10 ** 7):
+    """circ.describe versus calling resvec, mean, var and std."""
+    rand = np.random.RandomState(0)
+    vals = rand.vonmises(1., 2., size=n)
+
+    def separate(vals, axis=None):
+        return (circ.resvec(vals, axis=axis),
+                circ.mean(vals, axis=axis),
+                circ.var(vals, axis=axis),
+                circ.std(vals, axis=axis))
+
+    report("describe, %d angles" % n,
+           timeit(separate, vals),
+           timeit(circ.describe, vals))
+    vals = vals.reshape((1000, -1))
+    report("describe, %d angles, axis=1" % n,
+           timeit(separate, vals, axis=1),
+           timeit(circ.describe, vals, axis=1))
+
+
+def bench_grouped(n=10 ** 6, ngroups=10 ** 4):
+    """circ.mean with labels versus a Python loop over the groups."""
+    rand = np.random.RandomState(0)
+    vals = rand.vonmises(1., 2., size=n)
+    labels = rand.randint(0, ngroups, size=n)
+
+    def loop(vals, labels):
+        order = np.argsort(labels, kind='mergesort')
+        bounds = np.searchsorted(labels[order], np.arange(ngroups + 1))
+        sorted_vals = vals[order]
+        return [circ.mean(sorted_vals[bounds[i]:bounds[i + 1]])
+                for i in range(ngroups)]
+
+    report("mean, %d angles in %d groups" % (n, ngroups),
+           timeit(loop, vals, labels),
+           timeit(circ.mean, vals, labels=labels))
+
+
+def bench_rolling(n=2 * 10 ** 4, window=1000):
+    """circ.rolling_mean/var versus circ.mean/var on every window."""
+    rand = np.random.RandomState(0)
+    vals = rand.vonmises(1., 2., size=n)
+
+    def loop(vals, window):
+        m = [circ.mean(vals[i:i + window])
+             for i in range(len(vals) - window + 1)]
+        v = [circ.var(vals[i:i + window])
+             for i in range(len(vals) - window + 1)]
+        return m, v
+
+    def rolling(vals, window):
+        return (circ.rolling_mean(vals, window),
+                circ.rolling_var(vals, window))
+
+    report("rolling, %d angles, window %d" % (n, window),
+           timeit(loop, vals, window),
+           timeit(rolling, vals, window))
+
+
+def bench_threads(n=4 * 10 ** 7, n_jobs=-1):
+    """circ.resvec on one thread versus n_jobs threads."""
+    rand = np.random.RandomState(0)
+    vals = rand.vonmises(1., 2., size=n)
+    report("resvec, %d angles, n_jobs=%d" % (n, n_jobs),
+           timeit(circ.resvec, vals),
+           timeit(circ.resvec, vals, n_jobs=n_jobs))
+
+
+def bench_quantized(n=10 ** 7, steps=4096):
+    """circ.mean on encoder ticks versus on the angles they encode."""
+    rand = np.random.RandomState(0)
+    ticks = rand.randint(0, steps, size=n).astype('u2')
+
+    def scaled(ticks):
+        return circ.mean(ticks * (2.*np.pi / steps))
+
+    report("mean, %d ticks of %d" % (n, steps),
+           timeit(scaled, ticks),
+           timeit(circ.mean, ticks, steps=steps))
+    ticks = ticks.reshape((-1, 100))
+    report("mean, %d ticks of %d, axis=1" % (n, steps),
+           timeit(lambda t: circ.mean(t * (2.*np.pi / steps), axis=1), ticks),
+           timeit(circ.mean, ticks, axis=1, steps=steps))
+
+
+def bench_median(n=3000):
+    """circ.median versus checking every angle against every other."""
+    rand = np.random.RandomState(0)
+    vals = rand.vonmises(1., 2., size=n)
+
+    def naive(vals):
+        d = np.abs(vals[:, None] - vals[None, :]) % (2.*np.pi)
+        d = np.minimum(d, 2.*np.pi - d)
+        return vals[np.argmin(d.sum(axis=1))]
+
+    report("median, %d angles" % n,
+           timeit(naive, vals),
+           timeit(circ.median, vals))
+
+
+def bench_corrcc(n=1000, nvars=60):
+    """circ.corrcc on a whole array versus on each pair of columns."""
+    rand = np.random.RandomState(0)
+    vals = rand.vonmises(1., 2., size=(n, nvars))
+
+    def pairs(vals):
+        rho = np.empty((nvars, nvars))
+        for i in range(nvars):
+            for j in range(nvars):
+                rho[i, j] = circ.corrcc(vals[:, i], vals[:, j])
+        return rho
+
+    report("corrcc, %d samples of %d variables" % (n, nvars),
+           timeit(pairs, vals),
+           timeit(circ.corrcc, vals))
+
+
+def _old_normalize(logarr, axis=-1, max_log_value=709.78271289338397):
+    """misc.normalize as it was before it used logsumexp."""
+    shape = list(logarr.shape)
+    shape[axis] = 1
+    maxlogarr = np.max(logarr, axis=axis).reshape(shape)
+    shift = (max_log_value - maxlogarr - 2 - logarr.shape[axis])
+    unnormed = logarr + shift
+    arr = np.exp(unnormed)
+    _lognormconsts = np.log(np.sum(arr, axis=axis)).reshape(shape)
+    lognormarr = unnormed - _lognormconsts
+    _lognormconsts -= shift
+    lognormconsts = np.sum(_lognormconsts, axis=axis)
+    return lognormconsts, lognormarr
+
+
+def bench_normalize(n=10 ** 7, dtype='f8'):
+    """misc.normalize versus the old shift-based version."""
+    rand = np.random.RandomState(0)
+    logarr = rand.normal(-500., 100., size=(n // 1000, 1000)).astype(dtype)
+    report("normalize, %d %s values" % (n, dtype),
+           timeit(_old_normalize, logarr),
+           timeit(misc.normalize, logarr))
+    print("%-40s old: %8.1fMB new: %8.1fMB" % (
+        "  peak memory", peakmem(_old_normalize, logarr),
+        peakmem(misc.normalize, logarr)))
+    out = np.empty_like(logarr)
+    print("%-40s new: %8.1fMB" % (
+        "  peak memory, out=", peakmem(misc.normalize, logarr, out=out)))
+
+
+def bench_alias(n=10 ** 4, calls=100, num=10 ** 4):
+    """misc.AliasSampler versus np.random.choice, drawing repeatedly
+    from the same distribution.
+
+    """
+    rand = np.random.RandomState(0)
+    logweights = rand.normal(size=n)
+    p = np.exp(misc.normalize(logweights)[1])
+
+    def choice():
+        for i in range(calls):
+            rand.choice(n, size=num, p=p)
+
+    def alias():
+        sampler = misc.AliasSampler(logweights)
+        for i in range(calls):
+            sampler.sample(num)
+
+    report("%d draws of %d, %d categories" % (calls, num, n),
+           timeit(choice), timeit(alias))
+
+
+def bench_logdot(T=50, K=200):
+    """misc.logdot versus broadcasting to (T, K, K) and summing with
+    logsumexp, for a batch of T log-space matrix products.
+
+    """
+    rand = np.random.RandomState(0)
+    logA = rand.normal(-50., 10., size=(T, K, K))
+    logB = rand.normal(-50., 10., size=(T, K, K))
+
+    def broadcast(logA, logB):
+        return [misc.logsumexp(logA[t][:, :, None] + logB[t][None], axis=1)
+                for t in range(T)]
+
+    report("logdot, %d products of %dx%d" % (T, K, K),
+           timeit(broadcast, logA, logB),
+           timeit(misc.logdot, logA, logB))
+
+
+def bench_sparse(n=5000, density=0.01):
+    """misc.normalize on a sparse matrix versus the same values as a
+    dense array full of -inf.
+
+    """
+    import scipy.sparse
+    logmat = scipy.sparse.random(
+        n, n, density=density, format='csr', random_state=0)
+    logmat.data = np.log(logmat.data)
+    dense = np.full((n, n), -np.inf)
+    dense[logmat.nonzero()] = logmat.data
+    report("normalize, %dx%d at density %s" % (n, n, density),
+           timeit(misc.normalize, dense),
+           timeit(misc.normalize, logmat))
+
+
+def bench_gaussian_init(n=10 ** 4):
+    """Creating GaussianRVs (directly and through arithmetic) with a
+    lazily created random number generator, versus creating the
+    generator straight away as GaussianRV used to.
+
+    """
+    def eager():
+        for i in range(n):
+            GaussianRV(1., 2.).rand
+
+    def lazy():
+        for i in range(n):
+            GaussianRV(1., 2.)
+
+    report("construct %d GaussianRVs" % n, timeit(eager), timeit(lazy))
+
+    rv = GaussianRV(1., 2.)
+
+    def eager_arith():
+        for i in range(n):
+            ((rv + 1.).rand, (rv * 2.).rand, (rv * rv).rand)
+
+    def lazy_arith():
+        for i in range(n):
+            (rv + 1., rv * 2., rv * rv)
+
+    report("%d x (rv + 1, rv * 2, rv * rv)" % n,
+           timeit(eager_arith), timeit(lazy_arith))
+
+
+def bench_draw(n=10 ** 5, bufsize=4096):
+    """Drawing single samples with a buffered GaussianRV.draw versus
+    GaussianRV.sample(1).
+
+    """
+    rv = GaussianRV(1., 2.)
+    buffered = GaussianRV(1., 2.)
+    buffered.set_bufsize(bufsize)
+
+    def unbuffered_draws():
+        for i in range(n):
+            rv.sample()
+
+    def buffered_draws():
+        for i in range(n):
+            buffered.draw()
+
+    report("%d single draws" % n,
+           timeit(unbuffered_draws), timeit(buffered_draws))
+
+
+def bench_affine(n=10 ** 4):
+    """Chained scalar arithmetic folded into one lazy affine node,
+    versus building a concrete GaussianRV at every step.
+
+    """
+    rv = GaussianRV(1., 2.)
+
+    def eager():
+        for i in range(n):
+            x = GaussianRV(rv.mu * 2., rv.sigma * 2.)
+            x = GaussianRV(x.mu + 3., x.sigma)
+            x = GaussianRV(x.mu - 1., x.sigma)
+            GaussianRV(x.mu / 4., x.sigma / 4.)
+
+    def lazy():
+        for i in range(n):
+            (rv * 2. + 3. - 1.) / 4.
+
+    report("%d x (rv * 2 + 3 - 1) / 4" % n, timeit(eager), timeit(lazy))
+
+
+def bench_loglik(n=10 ** 6, grid=30):
+    """Log-likelihood of one dataset over a grid of parameters, from
+    its SufficientStats versus summing GaussianRV.logpdf each time.
+
+    """
+    vals = np.random.RandomState(0).normal(1., 2., n)
+    mu = np.linspace(0., 2., grid)
+    sigma = np.linspace(1., 3., grid)
+
+    def naive():
+        return np.array([[GaussianRV(m, s).logpdf(vals).sum()
+                          for s in sigma] for m in mu])
+
+    def cached():
+        stats = SufficientStats(vals)
+        return GaussianRVArray(mu[:, None], sigma[None, :]).loglik(stats)
+
+    report("loglik, %d points, %dx%d grid" % (n, grid, grid),
+           timeit(naive), timeit(cached))
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:]
+    if not names:
+        names = [k[6:] for k in sorted(globals()) if k.startswith("bench_")]
+    for name in names:
+        globals()["bench_" + name]()
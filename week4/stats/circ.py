@@ -1,21 +1,282 @@
 """Module containing circular statistics functions, including resvec,
-mean, var, and std.
+mean, var, std, describe, and their rolling-window versions, median
+and quantile, von Mises fitting and the Rayleigh test, circular
+correlation matrices, and the CircAccumulator class for computing them
+over data that arrives in chunks.
 
 """
 
-__all__ = ['resvec', 'mean', 'var', 'std']
+__all__ = ['resvec', 'mean', 'var', 'std', 'describe',
+           'median', 'quantile', 'vonmises_fit', 'rayleigh_test',
+           'corrcc', 'corrcl',
+           'rolling_mean', 'rolling_var', 'CircAccumulator']
+
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
-def resvec(vals, axis=None):
+# large arrays are processed in blocks that fit in
+# _blocked.MEMORY_BUDGET (shared with the misc module)
+from _blocked import _blocksize, _blocks, _axes, _dtype
+
+def _asarray(vals):
+    """Convert 'vals' to an array without copying it.  A string is
+    taken to be the path of a .npy file, which is memory-mapped rather
+    than read into memory.
+
+    """
+    if isinstance(vals, str):
+        return np.load(vals, mmap_mode='r')
+    return np.asarray(vals)
+
+def _map_blocks(func, indices, n_jobs):
+    """Call func on a list of block indices and return the tuple of
+    arrays that it returns.  If n_jobs > 1 (or n_jobs < 0, meaning
+    one per CPU), the list is split into n_jobs contiguous runs that
+    are handled by a pool of threads (NumPy releases the GIL in cos,
+    sin and sum), and the results of the runs are added together.
+
+    """
+    if n_jobs is None:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = multiprocessing.cpu_count()
+    n_jobs = min(n_jobs, len(indices))
+    if n_jobs <= 1:
+        return func(indices)
+
+    bounds = np.linspace(0, len(indices), n_jobs + 1).astype(int)
+    runs = [indices[bounds[i]:bounds[i + 1]] for i in range(n_jobs)]
+    pool = ThreadPool(n_jobs)
+    try:
+        results = pool.map(func, runs)
+    finally:
+        pool.close()
+    total = results[0]
+    for result in results[1:]:
+        for t, r in zip(total, result):
+            t += r
+    return total
+
+def _tables(steps, dtype):
+    """Cosines and sines of 'steps' equally spaced angles around the
+    circle, for looking up the values of quantized angles.
+
+    """
+    theta = np.arange(steps) * (2.*np.pi / steps)
+    return np.cos(theta).astype(dtype), np.sin(theta).astype(dtype)
+
+def _ticksums(ticks, tables):
+    """Sums of the cosines and sines of an array of ticks, found by
+    counting how often each tick occurs.
+
+    """
+    steps = len(tables[0])
+    ticks = np.ravel(ticks)
+    if steps > np.iinfo(ticks.dtype).max:
+        # 'steps' does not fit in the dtype (e.g., full-range uint8
+        # ticks with 256 steps): unsigned ticks are always in range,
+        # and signed ones are wrapped in a wider type
+        if ticks.dtype.kind != 'u':
+            ticks = np.remainder(ticks.astype(np.intp), steps)
+    else:
+        # wrap negative ticks and ticks from more than one revolution
+        # into [0, steps), so there are never more than 'steps' counts
+        ticks = np.remainder(ticks, steps)
+    counts = np.bincount(ticks, minlength=steps)
+    return np.dot(counts, tables[0]), np.dot(counts, tables[1])
+
+def _accumulate(alpha, axes, C, S, indices, tables=None):
+    """Add the sums of cos(alpha) and sin(alpha) over 'axes' into the
+    arrays C and S, in place, for each block of alpha given in
+    'indices'.  The cosines and sines are computed in the dtype of C,
+    or looked up in 'tables' if alpha holds quantized angles.
+
+    """
+    for index in indices:
+        block = alpha[index]
+        # axes of the block that are summed over, and the part of C
+        # and S that the block contributes to
+        k = sum(1 for i in index if not isinstance(i, slice))
+        blockaxes = tuple(a - k for a in axes if a >= k)
+        outindex = tuple(i for a, i in enumerate(index) if a not in axes)
+        if tables is None:
+            t = np.asarray(np.cos(block, dtype=C.dtype))
+            C[outindex] += np.sum(t, axis=blockaxes)
+            np.sin(block, out=t)
+            S[outindex] += np.sum(t, axis=blockaxes)
+        elif len(blockaxes) == block.ndim:
+            # the whole block is summed, so just count the ticks
+            c, s = _ticksums(block, tables)
+            C[outindex] += c
+            S[outindex] += s
+        else:
+            t = np.asarray(np.take(tables[0], block, mode='wrap'))
+            C[outindex] += np.sum(t, axis=blockaxes)
+            np.take(tables[1], block, mode='wrap', out=t)
+            S[outindex] += np.sum(t, axis=blockaxes)
+
+def _grouped_sums(alpha, labels, dtype, n_jobs, tables):
+    """Compute the sums of the cosines and sines of an array of angles
+    for each group given by an integer array of labels (of the same
+    shape), working through the data in blocks.
+
+    """
+    labels = _asarray(labels)
+    if labels.shape != alpha.shape:
+        raise ValueError(
+            "labels has shape %s, but vals has shape %s" % (
+                labels.shape, alpha.shape))
+    ngroups = int(labels.max()) + 1 if labels.size else 0
+
+    def partial(indices):
+        C = np.zeros(ngroups, dtype='f8')
+        S = np.zeros(ngroups, dtype='f8')
+        n = np.zeros(ngroups, dtype=int)
+        for index in indices:
+            a = np.ravel(alpha[index])
+            l = np.ravel(labels[index])
+            if tables is None:
+                c = np.cos(a, dtype=dtype)
+                s = np.sin(a, dtype=dtype)
+            else:
+                c = np.take(tables[0], a, mode='wrap')
+                s = np.take(tables[1], a, mode='wrap')
+            C += np.bincount(l, weights=c, minlength=ngroups)
+            S += np.bincount(l, weights=s, minlength=ngroups)
+            n += np.bincount(l, minlength=ngroups)
+        return C, S, n
+
+    # each element needs a float64 temporary
+    blocksize = _blocksize(alpha.dtype.itemsize + 8)
+    blocks = list(_blocks(alpha.shape, blocksize))
+    C, S, n = _map_blocks(partial, blocks, n_jobs)
+    # bincount always sums in float64
+    return C.astype(dtype), S.astype(dtype), n
+
+def _sums(vals, axis=None, labels=None, dtype=None, n_jobs=None,
+          steps=None):
+    """Compute the sums of the cosines and sines of an array of angles
+    along an axis (or within each labelled group), without ever
+    creating a full-size temporary or copying the input.  The input is
+    processed in blocks along its leading axes, so that the memory
+    used stays within _blocked.MEMORY_BUDGET per thread.  If 'steps'
+    is given, the values are integer ticks with 'steps' ticks per
+    revolution.
+
+    Returns
+    -------
+    out : tuple
+        (sum of cosines, sum of sines, number of angles summed)
+
+    """
+    alpha = _asarray(vals)
+    dtype = _dtype(alpha, dtype)
+    tables = None
+    if steps is not None:
+        if not np.issubdtype(alpha.dtype, np.integer):
+            raise ValueError(
+                "quantized angles must be integers, not %s" % alpha.dtype)
+        tables = _tables(steps, dtype)
+    if labels is not None:
+        if axis is not None:
+            raise ValueError("'axis' and 'labels' cannot both be given")
+        return _grouped_sums(alpha, labels, dtype, n_jobs, tables)
+    axes = _axes(alpha.ndim, axis)
+    shape = tuple(n for i, n in enumerate(alpha.shape) if i not in axes)
+
+    def partial(indices):
+        C = np.zeros(shape, dtype=dtype)
+        S = np.zeros(shape, dtype=dtype)
+        _accumulate(alpha, axes, C, S, indices, tables)
+        return C, S
+
+    blocksize = _blocksize(alpha.dtype.itemsize + dtype.itemsize)
+    blocks = list(_blocks(alpha.shape, blocksize))
+    C, S = _map_blocks(partial, blocks, n_jobs)
+    n = int(np.prod([alpha.shape[a] for a in axes]))
+    return C, S, n
+
+def _empty(C, out):
+    """Return 'out', or a new array to hold a result like C"""
+    if out is None:
+        return np.empty(C.shape, dtype=C.dtype)
+    if out.shape != C.shape:
+        raise ValueError(
+            "out has shape %s, expected %s" % (out.shape, C.shape))
+    return out
+
+def _result(r, out):
+    """Return 'out' if it was given, otherwise r (as a scalar if it
+    is zero-dimensional)
+
+    """
+    if out is None:
+        return r[()]
+    return out
+
+def _resvec(C, S, n, out=None):
+    """Mean resultant vector length from the sums of cosines and sines"""
+    r = _empty(C, out)
+    np.hypot(C, S, out=r)
+    # empty groups give nan
+    with np.errstate(invalid='ignore', divide='ignore'):
+        np.divide(r, n, out=r)
+    return _result(r, out)
+
+def _mean(C, S, n, out=None):
+    """Circular mean from the sums of n cosines and sines"""
+    mu = _empty(C, out)
+    np.arctan2(S, C, out=mu)
+    np.mod(mu, 2.*np.pi, out=mu)
+    # empty groups give nan (rather than arctan2(0, 0) = 0)
+    np.copyto(mu, np.nan, where=np.asarray(n) == 0)
+    return _result(mu, out)
+
+def _std(r, out=None):
+    """Circular standard deviation from the resultant vector length,
+    computed in place if r is 'out'.
+
+    """
+    std = _empty(np.asarray(r), out)
+    with np.errstate(divide='ignore'):
+        np.log(r, out=std)
+    np.multiply(std, -2, out=std)
+    np.sqrt(std, out=std)
+    return _result(std, out)
+
+def resvec(vals, axis=None, labels=None, dtype=None, out=None,
+           n_jobs=None, steps=None):
     """Calculate the mean resultant vector length for circular data.
 
     Parameters
     ----------
-    vals : array-like
-        The array of angles
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
     axis : int (default=None)
         The axis along which to take the mean
+    labels : array-like of ints (default=None)
+        Group label for each angle, with the same shape as 'vals'.  If
+        given, the result has one value per label 0...labels.max(),
+        and 'axis' must be None.
+    dtype : dtype (default=None)
+        The floating point type to compute in.  By default, floating
+        point input keeps its own precision and other input is
+        computed in float64.
+    out : np.ndarray (default=None)
+        Array to write the result into, which must have the right
+        shape.
+    n_jobs : int (default=None)
+        Number of threads to split the work across (-1 for one per
+        CPU).  The result does not depend on n_jobs, up to floating
+        point round-off.
+    steps : int (default=None)
+        If given, 'vals' are integer ticks (e.g. from an encoder) with
+        'steps' ticks per revolution, so tick k is the angle
+        2*pi*k/steps.  Their cosines and sines are looked up in a
+        table instead of being computed for every value.
 
     Returns
     -------
@@ -27,25 +288,43 @@ def resvec(vals, axis=None):
     http://www.jstatsoft.org/v31/i10
 
     """
-    
-    alpha = np.array(vals, dtype='f8')
-    # sum of cos & sin angles
-    t = np.exp(1j * alpha)
-    r = np.sum(t, axis=axis)
-    # obtain length 
-    r = np.abs(r) / alpha.shape[axis]
-    return r    
 
-def mean(vals, axis=None):
+    C, S, n = _sums(vals, axis=axis, labels=labels, dtype=dtype,
+                    n_jobs=n_jobs, steps=steps)
+    return _resvec(C, S, n, out=out)
+
+def mean(vals, axis=None, labels=None, dtype=None, out=None,
+         n_jobs=None, steps=None):
     """Calculate the mean of an array of angles using circular
     statistics.
 
     Parameters
     ----------
-    vals : array-like
-        The array of angles
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
     axis : int (default=None)
         The axis along which to take the mean
+    labels : array-like of ints (default=None)
+        Group label for each angle, with the same shape as 'vals'.  If
+        given, the result has one value per label 0...labels.max(),
+        and 'axis' must be None.
+    dtype : dtype (default=None)
+        The floating point type to compute in.  By default, floating
+        point input keeps its own precision and other input is
+        computed in float64.
+    out : np.ndarray (default=None)
+        Array to write the result into, which must have the right
+        shape.
+    n_jobs : int (default=None)
+        Number of threads to split the work across (-1 for one per
+        CPU).  The result does not depend on n_jobs, up to floating
+        point round-off.
+    steps : int (default=None)
+        If given, 'vals' are integer ticks (e.g. from an encoder) with
+        'steps' ticks per revolution, so tick k is the angle
+        2*pi*k/steps.  Their cosines and sines are looked up in a
+        table instead of being computed for every value.
 
     Returns
     -------
@@ -58,23 +337,41 @@ def mean(vals, axis=None):
 
     """
 
-    alpha = np.array(vals, dtype='f8')
-    # sum of cos & sin angles
-    t = np.exp(1j * alpha)
-    r = np.sum(t, axis=axis)
-    # obtain mean
-    mu = np.angle(r) % (2.*np.pi)                        
-    return mu
+    C, S, n = _sums(vals, axis=axis, labels=labels, dtype=dtype,
+                    n_jobs=n_jobs, steps=steps)
+    return _mean(C, S, n, out=out)
 
-def var(vals, axis=None):
+def var(vals, axis=None, labels=None, dtype=None, out=None,
+        n_jobs=None, steps=None):
     """Computes circular variance for circular data.
 
     Parameters
     ----------
-    vals : array-like
-        The array of angles
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
     axis : int (default=None)
         The axis along which to take the variance
+    labels : array-like of ints (default=None)
+        Group label for each angle, with the same shape as 'vals'.  If
+        given, the result has one value per label 0...labels.max(),
+        and 'axis' must be None.
+    dtype : dtype (default=None)
+        The floating point type to compute in.  By default, floating
+        point input keeps its own precision and other input is
+        computed in float64.
+    out : np.ndarray (default=None)
+        Array to write the result into, which must have the right
+        shape.
+    n_jobs : int (default=None)
+        Number of threads to split the work across (-1 for one per
+        CPU).  The result does not depend on n_jobs, up to floating
+        point round-off.
+    steps : int (default=None)
+        If given, 'vals' are integer ticks (e.g. from an encoder) with
+        'steps' ticks per revolution, so tick k is the angle
+        2*pi*k/steps.  Their cosines and sines are looked up in a
+        table instead of being computed for every value.
 
     Returns
     -------
@@ -87,19 +384,43 @@ def var(vals, axis=None):
 
     """
 
-    alpha = np.array(vals, dtype='f8')
-    var = 1. - resvec(alpha, axis=axis)
-    return var
+    C, S, n = _sums(vals, axis=axis, labels=labels, dtype=dtype,
+                    n_jobs=n_jobs, steps=steps)
+    v = _resvec(C, S, n, out=_empty(C, out))
+    np.subtract(1., v, out=v)
+    return _result(v, out)
 
-def std(vals, axis=None):
+def std(vals, axis=None, labels=None, dtype=None, out=None,
+        n_jobs=None, steps=None):
     """Computes circular standard deviation for circular data.
 
     Parameters
     ----------
-    vals : array-like
-        The array of angles
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
     axis : int (default=None)
         The axis along which to take the standard deviation
+    labels : array-like of ints (default=None)
+        Group label for each angle, with the same shape as 'vals'.  If
+        given, the result has one value per label 0...labels.max(),
+        and 'axis' must be None.
+    dtype : dtype (default=None)
+        The floating point type to compute in.  By default, floating
+        point input keeps its own precision and other input is
+        computed in float64.
+    out : np.ndarray (default=None)
+        Array to write the result into, which must have the right
+        shape.
+    n_jobs : int (default=None)
+        Number of threads to split the work across (-1 for one per
+        CPU).  The result does not depend on n_jobs, up to floating
+        point round-off.
+    steps : int (default=None)
+        If given, 'vals' are integer ticks (e.g. from an encoder) with
+        'steps' ticks per revolution, so tick k is the angle
+        2*pi*k/steps.  Their cosines and sines are looked up in a
+        table instead of being computed for every value.
 
     Returns
     -------
@@ -113,6 +434,549 @@ def std(vals, axis=None):
 
     """
 
-    var = var(vals, axis=axis)
-    std = np.sqrt(-2*np.log(1 - var))
-    return std
+    C, S, n = _sums(vals, axis=axis, labels=labels, dtype=dtype,
+                    n_jobs=n_jobs, steps=steps)
+    r = _resvec(C, S, n, out=_empty(C, out))
+    _std(r, out=r)
+    return _result(r, out)
+
+def describe(vals, axis=None, labels=None, dtype=None,
+             n_jobs=None, steps=None):
+    """Compute the resultant vector length, mean, variance and
+    standard deviation of circular data in a single pass.
+
+    This gives the same results as calling resvec, mean, var and std
+    separately, but only reads the data once and never creates a
+    temporary bigger than a small block of the input.
+
+    Parameters
+    ----------
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
+    axis : int (default=None)
+        The axis along which to compute the statistics
+    labels : array-like of ints (default=None)
+        Group label for each angle, with the same shape as 'vals'.  If
+        given, the results have one value per label 0...labels.max(),
+        and 'axis' must be None.
+    dtype : dtype (default=None)
+        The floating point type to compute in.  By default, floating
+        point input keeps its own precision and other input is
+        computed in float64.
+    n_jobs : int (default=None)
+        Number of threads to split the work across (-1 for one per
+        CPU).  The results do not depend on n_jobs, up to floating
+        point round-off.
+    steps : int (default=None)
+        If given, 'vals' are integer ticks (e.g. from an encoder) with
+        'steps' ticks per revolution, so tick k is the angle
+        2*pi*k/steps.  Their cosines and sines are looked up in a
+        table instead of being computed for every value.
+
+    Returns
+    -------
+    out : tuple
+        (resultant vector length, mean, variance, standard deviation)
+
+    References
+    ----------
+    http://www.jstatsoft.org/v31/i10
+
+    """
+
+    C, S, n = _sums(vals, axis=axis, labels=labels, dtype=dtype,
+                    n_jobs=n_jobs, steps=steps)
+    r = _resvec(C, S, n)
+    return r, _mean(C, S, n), 1. - r, _std(r)
+
+def _sorted_rows(vals, axis):
+    """Wrap an array of angles into [0, 2pi) and sort it along an
+    axis.  Returns the sorted angles as a 2D array with one row per
+    output value, and the shape of the output.
+
+    """
+    alpha = _asarray(vals)
+    if axis is None:
+        alpha = alpha.reshape((1, -1))
+        shape = ()
+    else:
+        alpha = np.rollaxis(alpha, axis % alpha.ndim, alpha.ndim)
+        shape = alpha.shape[:-1]
+        alpha = alpha.reshape((-1, alpha.shape[-1]))
+    x = np.mod(alpha, 2.*np.pi, dtype=_dtype(alpha, None))
+    x.sort(axis=1)
+    return x, shape
+
+def _median_sorted(x):
+    """Circular medians of the rows of a sorted 2D array of angles in
+    [0, 2pi).
+
+    The median is the angle that minimizes the sum of the circular
+    distances to all the others, and is always one of the angles.  If
+    the angles are unrolled as y = (x, x + 2pi), the points within
+    half a circle ahead of x[j] are y[j:h] (found by a binary search
+    for x[j] + pi) and the rest are y[h:j+n].  With prefix sums of y,
+    the sum of distances to each x[j] is then O(1), so the whole
+    median costs O(n log n).
+
+    """
+    m, n = x.shape
+    y = np.concatenate([x, x + 2.*np.pi], axis=1)
+    P = np.zeros((m, 2*n + 1))
+    np.cumsum(y, axis=1, out=P[:, 1:])
+    # search all the rows at once, by shifting each row into its own
+    # range so that the flattened array is still sorted
+    rows = np.arange(m)[:, None]
+    shift = rows * 4.*np.pi
+    h = np.searchsorted(
+        (y + shift).ravel(), (x + np.pi + shift).ravel(), 'left')
+    h = h.reshape((m, n)) - rows * 2*n
+    j = np.arange(n)
+    ahead = P[rows, h] - P[:, :n] - (h - j) * x
+    behind = (j + n - h) * (x + 2.*np.pi) - (P[:, n:2*n] - P[rows, h])
+    best = np.argmin(ahead + behind, axis=1)
+    return x[np.arange(m), best]
+
+def median(vals, axis=None):
+    """Calculate the circular median of an array of angles: the angle
+    (one of the data points) that minimizes the sum of the circular
+    distances to all of the angles.  This takes O(n log n) time.
+
+    Parameters
+    ----------
+    vals : array-like or str
+        The array of angles, or the path of a .npy file
+    axis : int (default=None)
+        The axis along which to take the median
+
+    Returns
+    -------
+    out : np.ndarray
+        The resulting numpy array of medians, in [0, 2pi)
+
+    References
+    ----------
+    http://www.jstatsoft.org/v31/i10
+
+    """
+
+    x, shape = _sorted_rows(vals, axis)
+    return _median_sorted(x).reshape(shape)[()]
+
+def quantile(vals, q, axis=None):
+    """Calculate circular quantiles of an array of angles.  The angles
+    are unwrapped to within half a circle of their circular median,
+    and the usual (linear) quantiles of the result are taken.  This
+    takes O(n log n) time.
+
+    Parameters
+    ----------
+    vals : array-like or str
+        The array of angles, or the path of a .npy file
+    q : float or array-like
+        The quantile(s) to compute, between 0 and 1
+    axis : int (default=None)
+        The axis along which to take the quantiles
+
+    Returns
+    -------
+    out : np.ndarray
+        The resulting numpy array of quantiles, in [0, 2pi).  As with
+        np.percentile, the axes of 'q' come first.
+
+    """
+
+    x, shape = _sorted_rows(vals, axis)
+    med = _median_sorted(x)[:, None]
+    # angles relative to the median, in [-pi, pi)
+    dev = np.mod(x - med + np.pi, 2.*np.pi) - np.pi
+    out = np.percentile(dev, 100. * np.asarray(q), axis=1) + med[:, 0]
+    out = np.mod(out, 2.*np.pi)
+    return out.reshape(np.shape(q) + shape)[()]
+
+def vonmises_fit(vals, axis=None, labels=None):
+    """Fit a von Mises distribution to circular data, estimating the
+    mean direction and the concentration parameter kappa (including
+    the correction for small samples).  A whole batch of independent
+    sets of angles can be fit at once, either as rows of an array
+    (using 'axis') or as groups of a flat array (using 'labels').
+
+    Parameters
+    ----------
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
+    axis : int (default=None)
+        The axis along which the samples of each set lie
+    labels : array-like of ints (default=None)
+        Set label for each angle, with the same shape as 'vals'.  If
+        given, the results have one value per label 0...labels.max(),
+        and 'axis' must be None.
+
+    Returns
+    -------
+    out : tuple
+        (mean direction, kappa)
+
+    References
+    ----------
+    http://www.jstatsoft.org/v31/i10
+    Fisher, N. I. (1993). Statistical Analysis of Circular Data.
+
+    """
+
+    C, S, n = _sums(vals, axis=axis, labels=labels)
+    r = np.asarray(_resvec(C, S, n))
+    n = np.broadcast_to(n, r.shape)
+    r3 = r ** 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kappa = np.where(
+            r < 0.53, 2*r + r3 + 5*r3*r*r/6.,
+            np.where(r < 0.85, -0.4 + 1.39*r + 0.43/(1 - r),
+                     1. / (r3 - 4*r*r + 3*r)))
+        # correct the bias for small samples
+        small = (n > 1) & (n < 15)
+        kappa = np.where(
+            small & (kappa < 2),
+            np.maximum(kappa - 2. / (n*kappa), 0),
+            kappa)
+        kappa = np.where(
+            small & (kappa >= 2),
+            (n - 1.)**3 * kappa / (n**3 + n),
+            kappa)
+    return _mean(C, S, n), kappa[()]
+
+def rayleigh_test(vals, axis=None, labels=None):
+    """Rayleigh test for non-uniformity of circular data, against the
+    alternative of a unimodal distribution.  A whole batch of
+    independent sets of angles can be tested at once, either as rows
+    of an array (using 'axis') or as groups of a flat array (using
+    'labels').
+
+    Parameters
+    ----------
+    vals : array-like or str
+        The array of angles, or the path of a .npy file, which is
+        memory-mapped and reduced in blocks
+    axis : int (default=None)
+        The axis along which the samples of each set lie
+    labels : array-like of ints (default=None)
+        Set label for each angle, with the same shape as 'vals'.  If
+        given, the results have one value per label 0...labels.max(),
+        and 'axis' must be None.
+
+    Returns
+    -------
+    out : tuple
+        (p-value, Rayleigh's z statistic)
+
+    References
+    ----------
+    http://www.jstatsoft.org/v31/i10
+    Zar, J. H. (1999). Biostatistical Analysis, 4th ed.
+
+    """
+
+    C, S, n = _sums(vals, axis=axis, labels=labels)
+    # squared length of the (unnormalized) resultant vector
+    R2 = C*C + S*S
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = R2 / n
+        pval = np.exp(np.sqrt(1 + 4*n + 4*(n*n - R2)) - (1 + 2*n))
+    # empty groups give nan, like z
+    pval = np.where(np.asarray(n) == 0, np.nan, pval)[()]
+    return pval, z
+
+def _columns(vals):
+    """Make a 2D (samples, variables) array out of 'vals', treating a
+    1D array as a single variable.
+
+    """
+    vals = _asarray(vals)
+    if vals.ndim == 1:
+        vals = vals[:, None]
+    return vals
+
+def _centered_sines(alpha):
+    """Sines of each column of angles, relative to its circular mean,
+    along with the square root of their sum of squares.
+
+    """
+    sa = np.sin(alpha - mean(alpha, axis=0))
+    return sa, np.sqrt(np.sum(sa * sa, axis=0))
+
+def corrcc(alpha, beta=None):
+    """Circular-circular correlation coefficients between every pair
+    of variables, computed with matrix products of the sines of the
+    angles relative to their circular means.
+
+    Parameters
+    ----------
+    alpha : array-like
+        An array of angles of shape (samples, variables)
+    beta : array-like (default=None)
+        A second array of angles of shape (samples, variables).  If
+        not given, the correlations between the variables of 'alpha'
+        are computed.
+
+    Returns
+    -------
+    out : np.ndarray
+        The matrix of correlations, with a row for each variable of
+        'alpha' and a column for each variable of 'beta' (a single
+        value if both are 1D)
+
+    References
+    ----------
+    http://www.jstatsoft.org/v31/i10
+    Jammalamadaka, S. R. & SenGupta, A. (2001). Topics in Circular
+    Statistics, section 8.2.
+
+    """
+
+    sa, na = _centered_sines(_columns(alpha))
+    if beta is None:
+        sb, nb = sa, na
+    else:
+        sb, nb = _centered_sines(_columns(beta))
+    rho = np.dot(sa.T, sb) / np.outer(na, nb)
+    if np.ndim(alpha) == 1 and (beta is None or np.ndim(beta) == 1):
+        rho = rho[0, 0]
+    return rho
+
+def _standardize(vals):
+    """Shift and scale each column to zero mean and unit variance."""
+    vals = vals - np.mean(vals, axis=0)
+    vals /= np.std(vals, axis=0)
+    return vals
+
+def corrcl(alpha, x):
+    """Circular-linear correlation coefficients between every circular
+    variable and every linear variable, computed with matrix products
+    of the standardized data.
+
+    Parameters
+    ----------
+    alpha : array-like
+        An array of angles of shape (samples, circular variables)
+    x : array-like
+        An array of linear values of shape (samples, linear variables)
+
+    Returns
+    -------
+    out : np.ndarray
+        The matrix of correlations (between 0 and 1), with a row for
+        each variable of 'alpha' and a column for each variable of 'x'
+        (a single value if both are 1D)
+
+    References
+    ----------
+    http://www.jstatsoft.org/v31/i10
+    Mardia, K. V. & Jupp, P. E. (2000). Directional Statistics,
+    section 11.2.
+
+    """
+
+    a = _columns(alpha)
+    n = a.shape[0]
+    zc = _standardize(np.cos(a))
+    zs = _standardize(np.sin(a))
+    zx = _standardize(_columns(x).astype('f8'))
+    # linear correlations of x with cos and sin, and between them
+    rxc = np.dot(zc.T, zx) / n
+    rxs = np.dot(zs.T, zx) / n
+    rcs = (np.sum(zc * zs, axis=0) / n)[:, None]
+    rho = np.sqrt(
+        (rxc**2 + rxs**2 - 2*rxc*rxs*rcs) / (1 - rcs**2))
+    if np.ndim(alpha) == 1 and np.ndim(x) == 1:
+        rho = rho[0, 0]
+    return rho
+
+def _rolling_sums(vals, window, axis, dtype):
+    """Compute the sums of the cosines and sines of every window of
+    'window' consecutive angles along an axis, from their cumulative
+    sums (which are kept in float64 to limit round-off).
+
+    """
+    alpha = _asarray(vals)
+    dtype = _dtype(alpha, dtype)
+    axis = axis % alpha.ndim
+    n = alpha.shape[axis]
+    if not 1 <= window <= n:
+        raise ValueError(
+            "window must be between 1 and %d, got %s" % (n, window))
+
+    def along(sl):
+        # index 'sl' along the axis
+        return (slice(None),) * axis + (sl,)
+
+    shape = list(alpha.shape)
+    shape[axis] = n + 1
+    sums = []
+    for func in (np.cos, np.sin):
+        cum = np.zeros(shape, dtype='f8')
+        func(alpha, out=cum[along(slice(1, None))])
+        np.cumsum(cum, axis=axis, out=cum)
+        win = (cum[along(slice(window, None))] -
+               cum[along(slice(None, -window))])
+        sums.append(win.astype(dtype, copy=False))
+    return sums[0], sums[1], window
+
+def rolling_mean(vals, window, axis=-1, dtype=None):
+    """Calculate the circular mean of every window of 'window'
+    consecutive angles along an axis.  Each window costs O(1), using
+    cumulative sums of the cosines and sines.
+
+    Parameters
+    ----------
+    vals : array-like
+        The array of angles
+    window : int
+        The number of angles in each window
+    axis : int (default=-1)
+        The axis along which the windows slide
+    dtype : dtype (default=None)
+        The floating point type of the result.  By default, floating
+        point input keeps its own precision and other input gives
+        float64.
+
+    Returns
+    -------
+    out : np.ndarray
+        The means, with length n - window + 1 along 'axis', where
+        element i is the mean of angles i to i + window - 1
+
+    """
+
+    C, S, n = _rolling_sums(vals, window, axis, dtype)
+    return _mean(C, S, n)
+
+def rolling_var(vals, window, axis=-1, dtype=None):
+    """Calculate the circular variance of every window of 'window'
+    consecutive angles along an axis.  Each window costs O(1), using
+    cumulative sums of the cosines and sines.
+
+    Parameters
+    ----------
+    vals : array-like
+        The array of angles
+    window : int
+        The number of angles in each window
+    axis : int (default=-1)
+        The axis along which the windows slide
+    dtype : dtype (default=None)
+        The floating point type of the result.  By default, floating
+        point input keeps its own precision and other input gives
+        float64.
+
+    Returns
+    -------
+    out : np.ndarray
+        The variances, with length n - window + 1 along 'axis', where
+        element i is the variance of angles i to i + window - 1
+
+    """
+
+    C, S, n = _rolling_sums(vals, window, axis, dtype)
+    v = _resvec(C, S, n)
+    np.subtract(1., v, out=v)
+    return v
+
+
+class CircAccumulator(object):
+    """Running circular statistics for data that arrives in chunks.
+
+    Keeps the sums of the cosines and sines of all the angles seen so
+    far (one per output cell), along with a count.  Chunks are added
+    with update(), and accumulators that were filled separately (e.g.,
+    in different processes) can be combined with merge().  The
+    resultant vector length, mean, variance and standard deviation
+    are only computed when asked for.
+
+    Parameters
+    ----------
+    axis : int (default=None)
+        The axis of each chunk along which to reduce.  If None, every
+        chunk is reduced to a single value.
+    dtype : dtype (default='f8')
+        The floating point type of the running sums.
+
+    """
+
+    def __init__(self, axis=None, dtype='f8'):
+        self.axis = axis
+        self.dtype = dtype
+        self.C = None
+        self.S = None
+        self.n = 0
+
+    def update(self, chunk):
+        """Add a chunk of angles.  Apart from along 'axis', every
+        chunk must have the same shape.
+
+        """
+        C, S, n = _sums(chunk, axis=self.axis, dtype=self.dtype)
+        if self.C is None:
+            self.C, self.S = C, S
+        elif C.shape != self.C.shape:
+            raise ValueError(
+                "chunk reduces to shape %s, expected %s" % (
+                    C.shape, self.C.shape))
+        else:
+            self.C += C
+            self.S += S
+        self.n += n
+        return self
+
+    def merge(self, other):
+        """Add the sums from another CircAccumulator to this one."""
+        if not isinstance(other, CircAccumulator):
+            raise ValueError(
+                "'other' is a %s" % type(other).__name__)
+        if other.C is None:
+            return self
+        if self.C is None:
+            self.C = other.C.copy()
+            self.S = other.S.copy()
+        elif other.C.shape != self.C.shape:
+            raise ValueError(
+                "cannot merge accumulators with shapes %s and %s" % (
+                    self.C.shape, other.C.shape))
+        else:
+            self.C += other.C
+            self.S += other.S
+        self.n += other.n
+        return self
+
+    def _check(self):
+        if self.n == 0:
+            raise ValueError("no data has been added")
+
+    @property
+    def resvec(self):
+        """The mean resultant vector length of the data so far"""
+        self._check()
+        return _resvec(self.C, self.S, self.n)
+
+    @property
+    def mean(self):
+        """The circular mean of the data so far"""
+        self._check()
+        return _mean(self.C, self.S, self.n)
+
+    @property
+    def var(self):
+        """The circular variance of the data so far"""
+        return 1. - self.resvec
+
+    @property
+    def std(self):
+        """The circular standard deviation of the data so far"""
+        return _std(self.resvec)
+
+    def __str__(self):
+        """String representation of the CircAccumulator"""
+        mytype = type(self).__name__
+        s = "<%s; axis=%s; n=%s>" % (mytype, self.axis, self.n)
+        return s
@@ -1,47 +1,641 @@
 import numpy as np
 
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
 
-def normalize(logarr, axis=-1, max_log_value=709.78271289338397):
+# np.memmap arrays are processed in blocks that fit in
+# _blocked.MEMORY_BUDGET (shared with the circ module)
+from _blocked import _blocksize, _blocks, _axes, _dtype
+
+
+def _shift(m):
+    """The amount to shift values by before exponentiating, given
+    their maximum m: m itself, or zero where m is infinite (or nan),
+    so that an all -inf slice gives a sum of zero rather than nan.
+
+    """
+    return np.where(np.isfinite(m), m, 0)
+
+
+def _maxsum(logarr, axis, scratch):
+    """Compute the maximum m of an array of log-values along an axis,
+    and the sum of exp(logarr - _shift(m)), both with the axis kept.
+    The shifted and exponentiated values are written into 'scratch',
+    which must have the same shape as logarr.
+
+    An all -inf slice keeps a maximum of -inf (and gets a sum of
+    zero), so that it never lowers the maximum it is combined with.
+
+    """
+    m = np.max(logarr, axis=axis, keepdims=True)
+    np.subtract(logarr, _shift(m), out=scratch)
+    np.exp(scratch, out=scratch)
+    s = np.sum(scratch, axis=axis, keepdims=True)
+    return m, s
+
+
+def _combine(m0, s0, m1, s1):
+    """Combine two (maximum, sum of exp(values - _shift(maximum)))
+    pairs into one, rescaling the sums to the larger maximum.  A pair
+    with a maximum of -inf (no values) contributes nothing.
+
+    """
+    m = np.maximum(m0, m1)
+    shift = _shift(m)
+    d0 = np.where(m0 == -np.inf, -np.inf, _shift(m0) - shift)
+    d1 = np.where(m1 == -np.inf, -np.inf, _shift(m1) - shift)
+    s = s0 * np.exp(d0) + s1 * np.exp(d1)
+    return m, s
+
+
+def logsumexp(logarr, axis=-1, keepdims=False, out=None, scratch=None):
+    """Compute log(sum(exp(logarr))) along an axis, without underflow
+    or overflow, by subtracting the maximum before exponentiating.
+
+    Parameters
+    ----------
+    logarr : array-like
+        An array of values in log-space.
+    axis : int or tuple of ints (default=-1)
+        The axis or axes along which to sum.
+    keepdims : bool (default=False)
+        Whether to keep the summed axis, with length one.
+    out : np.ndarray (default=None)
+        Array to write the result into.
+    scratch : np.ndarray (default=None)
+        Array with the same shape as logarr to use for the exponentiated
+        values, which is overwritten.  If not given, one is allocated;
+        this is the only full-size temporary.
+
+    """
+
+    logarr = np.asarray(logarr)
+    if scratch is None:
+        scratch = np.empty(logarr.shape, dtype=_dtype(logarr))
+    m, s = _maxsum(logarr, axis, scratch)
+    # an empty (all -inf) slice has a log-sum of -inf
+    with np.errstate(divide='ignore'):
+        np.log(s, out=s)
+    s += m
+    if not keepdims:
+        s = np.squeeze(s, axis=axis)
+    if out is None:
+        return s[()]
+    out[...] = s
+    return out
+
+
+def _normalize_blocks(logarr, axis, out, keepdims):
+    """Normalize an array (e.g., an np.memmap too big to fit in
+    memory) in blocks along its leading axes, in two passes.  The
+    first pass finds the maximum and the sum of the shifted
+    exponentials of each slice, combining them across blocks; the
+    second writes the normalized blocks to 'out'.
+
+    """
+    axes = _axes(logarr.ndim, axis)
+    dtype = _dtype(logarr)
+    cshape = tuple(1 if a in axes else n for a, n in enumerate(logarr.shape))
+    # running maxima start at -inf (no values yet); parts of slices
+    # that are all -inf keep them there rather than resetting them
+    m = np.empty(cshape, dtype=dtype)
+    m.fill(-np.inf)
+    s = np.zeros(cshape, dtype=dtype)
+    blocksize = _blocksize(2 * dtype.itemsize)
+    blocks = []
+    for index in _blocks(logarr.shape, blocksize):
+        # which axes of the block are normalized over, and the part
+        # of the constants that the block contributes to
+        k = sum(1 for i in index if not isinstance(i, slice))
+        blockaxes = tuple(a - k for a in axes if a >= k)
+        cindex = []
+        for a, i in enumerate(index):
+            if a not in axes:
+                cindex.append(i)
+            elif isinstance(i, slice):
+                cindex.append(slice(None))
+            else:
+                cindex.append(0)
+        cindex = tuple(cindex)
+        blocks.append((index, cindex))
+
+        block = logarr[index]
+        scratch = np.empty(block.shape, dtype=dtype)
+        bm, bs = _maxsum(block, blockaxes, scratch)
+        m[cindex], s[cindex] = _combine(m[cindex], s[cindex], bm, bs)
+
+    with np.errstate(divide='ignore'):
+        lognormconsts = np.log(s) + m
+    for index, cindex in blocks:
+        out[index] = logarr[index] - lognormconsts[cindex]
+    if not keepdims:
+        lognormconsts = np.squeeze(lognormconsts, axis=axes)
+    return lognormconsts[()], out
+
+
+def _normalize_sparse(logmat, axis, keepdims):
+    """Normalize a scipy.sparse matrix of log-values along its rows
+    (axis=1) or columns (axis=0), where the entries that are not
+    stored are taken to be -inf (i.e., zero probability).  Only the
+    stored entries are ever touched, by reducing over the segments of
+    a CSR (for rows) or CSC (for columns) matrix.
+
+    """
+    if axis not in (0, 1, -1, -2):
+        raise ValueError("axis must be 0 or 1 for sparse matrices")
+    axis = axis % 2
+    if axis == 1:
+        mat = logmat.tocsr()
+    else:
+        mat = logmat.tocsc()
+    keep = np.isfinite(mat.data)
+    if not keep.all():
+        # stored -inf (or other non-finite) entries, e.g. from
+        # csr_matrix(dense_logarr), are dropped like unstored ones
+        indptr = np.concatenate([[0], np.cumsum(keep)])[mat.indptr]
+        mat = type(mat)((mat.data[keep], mat.indices[keep], indptr),
+                        shape=mat.shape)
+    data = mat.data
+    lengths = np.diff(mat.indptr)
+    nonempty = lengths > 0
+    starts = mat.indptr[:-1][nonempty]
+
+    m = np.zeros(len(lengths), dtype=_dtype(data))
+    m[nonempty] = np.maximum.reduceat(data, starts)
+    shifted = data - np.repeat(m, lengths)
+    s = np.zeros(len(lengths), dtype=m.dtype)
+    s[nonempty] = np.add.reduceat(np.exp(shifted), starts)
+    # an empty row or column has a normalization constant of -inf
+    with np.errstate(divide='ignore'):
+        lognormconsts = np.log(s) + m
+    shifted -= np.repeat(lognormconsts - m, lengths)
+
+    normed = type(mat)((shifted, mat.indices, mat.indptr), shape=mat.shape)
+    normed = normed.asformat(logmat.format)
+    if keepdims:
+        lognormconsts = np.expand_dims(lognormconsts, axis)
+    return lognormconsts, normed
+
+
+def normalize(logarr, axis=-1, out=None, keepdims=False):
     """Normalize an array of log-values along an axis.  Returns a
     tuple of (normalization constants, normalized array), where both
     values are again in logspace.
 
     This function is useful for values that are in danger of
     underflowing when exponentiated.  It circumvents this problem by
-    shifting all the values and normalizing by a shifted normalization
-    constant.
+    subtracting the maximum along the axis before exponentiating (the
+    "logsumexp" trick).  The normalized array is the only full-size
+    array that is allocated, and it doubles as the scratch space for
+    the exponentiated values.  Floating point input keeps its own
+    precision (e.g., float32).
+
+    An np.memmap is normalized in blocks that fit in the memory
+    budget (_blocked.MEMORY_BUDGET), in two passes over the data, so
+    that it never needs to fit in memory.  In that case 'out' must be
+    given, and should usually be an np.memmap as well (e.g., from
+    np.lib.format.open_memmap), or logarr itself if it was opened for
+    writing.
+
+    A scipy.sparse matrix is taken to hold log-values only where it
+    has stored entries, and to be -inf (zero probability) everywhere
+    else.  It is normalized along its rows or columns without being
+    made dense, and the normalized matrix is returned in the same
+    sparse format.  Stored entries that are not finite are ignored.
+    Note that a log-value of 0.0 (probability one) must be stored
+    explicitly: building the matrix from a dense array (e.g.,
+    csr_matrix(dense_logarr)) drops such entries, as do
+    eliminate_zeros() and toarray() on the normalized matrix, whose
+    0.0 entries are stored explicitly.  Build it from the finite
+    entries instead, e.g. csr_matrix((data, (rows, cols))).
 
     Parameters
     ----------
     logarr : array-like
         An array of values in log-space.
+    axis : int or tuple of ints (default=-1)
+        The axis or axes along which to normalize the values.  With
+        several axes, the values are normalized jointly over them
+        (e.g., a joint distribution), working directly on the strided
+        array without reshaping or copying it.
+    out : np.ndarray (default=None)
+        Array to write the normalized values into, which may be logarr
+        itself (in which case one scratch array is allocated).
+    keepdims : bool (default=False)
+        Whether to keep the normalized axes (with length one) in the
+        normalization constants, so they broadcast against logarr.
+
+    """
+
+    if out is not None and not isinstance(out, np.ndarray):
+        # catch calls that still pass max_log_value, which used to be
+        # the third argument
+        raise ValueError(
+            "out must be an np.ndarray, not %s (normalize no longer "
+            "takes a max_log_value argument)" % type(out).__name__)
+
+    if sparse is not None and sparse.issparse(logarr):
+        if out is not None:
+            raise ValueError("out is not supported for sparse matrices")
+        return _normalize_sparse(logarr, axis, keepdims)
+
+    if isinstance(logarr, np.memmap):
+        if out is None:
+            raise ValueError(
+                "out must be given for an np.memmap (e.g., another "
+                "np.memmap from np.lib.format.open_memmap)")
+        return _normalize_blocks(logarr, axis, out, keepdims)
+
+    logarr = np.asarray(logarr)
+    if out is None:
+        out = np.empty(logarr.shape, dtype=_dtype(logarr))
+    if np.may_share_memory(out, logarr):
+        scratch = None
+    else:
+        scratch = out
+    lognormconsts = logsumexp(
+        logarr, axis=axis, keepdims=True, scratch=scratch)
+    np.subtract(logarr, lognormconsts, out=out)
+    if not keepdims:
+        # get rid of the dimensions we normalized over
+        lognormconsts = np.squeeze(lognormconsts, axis=axis)
+    return lognormconsts[()], out
+
+
+def logdot(logA, logB):
+    """Compute log(exp(logA) @ exp(logB)), i.e. a matrix product of
+    arrays stored in log-space, without underflow or overflow.
+
+    The rows of logA and the columns of logB are shifted by their
+    maxima before exponentiating, so the product itself can be done
+    with an ordinary (BLAS) matrix multiplication and only needs
+    memory for the inputs and the result.  The rare entries that
+    underflow this way (to zero or to subnormal numbers, because the
+    terms that dominate them are far below both maxima) are
+    recomputed exactly, in chunks; entries that are exactly -inf (no
+    pair of finite terms) are left alone.  As with np.matmul, any
+    leading axes are treated as batches of matrices, and 1D arrays are
+    treated as vectors.
+
+    Parameters
+    ----------
+    logA : array-like
+        Array of log-values of shape (..., n, k), or (k,)
+    logB : array-like
+        Array of log-values of shape (..., k, m), or (k,)
+
+    """
+
+    logA = np.asarray(logA)
+    logB = np.asarray(logB)
+    vecA = logA.ndim == 1
+    vecB = logB.ndim == 1
+    if vecA:
+        logA = logA[None, :]
+    if vecB:
+        logB = logB[:, None]
+
+    mA = np.max(logA, axis=-1, keepdims=True)
+    mA[~np.isfinite(mA)] = 0
+    mB = np.max(logB, axis=-2, keepdims=True)
+    mB[~np.isfinite(mB)] = 0
+    prod = np.matmul(np.exp(logA - mA), np.exp(logB - mB))
+    # subnormal results have lost precision as well as zero ones
+    underflow = prod < np.finfo(prod.dtype).tiny
+    if underflow.any():
+        # entries with no pair of finite terms are exactly -inf (e.g.,
+        # the structural zeros of a transition matrix) and are fine;
+        # only those with some finite pair really underflowed
+        finiteA = (logA > -np.inf).astype(prod.dtype)
+        finiteB = (logB > -np.inf).astype(prod.dtype)
+        underflow &= np.matmul(finiteA, finiteB) > 0
+    bad = np.nonzero(underflow)
+    with np.errstate(divide='ignore'):
+        np.log(prod, out=prod)
+    prod += mA
+    prod += mB
+
+    if len(bad[0]):
+        # recompute the entries that underflowed from the rows of logA
+        # and columns of logB that give them, a chunk at a time so the
+        # (entries, k) temporaries stay within the memory budget
+        batch = prod.shape[:-2]
+        A = np.broadcast_to(logA, batch + logA.shape[-2:])
+        B = np.swapaxes(np.broadcast_to(logB, batch + logB.shape[-2:]),
+                        -1, -2)
+        k = logA.shape[-1]
+        chunk = _blocksize(3 * k * prod.dtype.itemsize)
+        for start in range(0, len(bad[0]), chunk):
+            idx = tuple(i[start:start + chunk] for i in bad)
+            terms = A[idx[:-2] + (idx[-2],)]
+            terms += B[idx[:-2] + (idx[-1],)]
+            prod[idx] = logsumexp(terms, axis=-1)
+
+    if vecA:
+        prod = prod[..., 0, :]
+    if vecB:
+        prod = prod[..., 0]
+    return prod[()]
+
+
+def _alias_finish(q, alias, small, large, n):
+    """Finish building alias tables one pair at a time (Vose's
+    method), for the few entries left when the vectorized rounds in
+    _alias_table stop making much progress.
+
+    """
+    small = list(small)
+    large = list(large)
+    while small and large:
+        # pair up the last small and large entries of the same row
+        row = max(small[-1] // n, large[-1] // n)
+        if small[-1] // n != row:
+            large.pop()
+            continue
+        if large[-1] // n != row:
+            small.pop()
+            continue
+        s = small.pop()
+        l = large[-1]
+        alias[s] = l
+        q[l] -= 1 - q[s]
+        if q[l] < 1:
+            large.pop()
+            small.append(l)
+    return small + large
+
+
+def _alias_table(prob):
+    """Build alias tables for the rows of a 2D array of probabilities,
+    each scaled to sum to the row length n.  Returns the probability
+    of keeping each entry and the entry to use otherwise (its alias).
+
+    Vose's method pairs each entry with q < 1 ("small") with one with
+    q >= 1 ("large"), which gives up 1 - q of its mass.  Here all the
+    small entries are paired at once in each round: the deficits of
+    the small entries in a row are laid end to end, as are the
+    surpluses of the large entries, and each small entry is paired
+    with the large entry whose surplus its deficit starts in.  Large
+    entries left with q < 1 become the small entries of the next
+    round.
+
+    """
+    rows, n = prob.shape
+    q = prob.ravel().copy()
+    alias = np.arange(q.size)
+    small = np.flatnonzero(q < 1)
+    large = np.flatnonzero(q >= 1)
+    while len(small) and len(large):
+        # small entries in rows without large ones are only there
+        # through round-off, and are left alone
+        has_large = np.bincount(large // n, minlength=rows) > 0
+        small = small[has_large[small // n]]
+        if len(small) < 32:
+            leftover = _alias_finish(q, alias, small, large, n)
+            small = large = np.array(leftover, dtype=int)
+            break
+
+        srow = small // n
+        lrow = large // n
+        deficit = 1 - q[small]
+        surplus = q[large] - 1
+        # where each deficit starts, and where each surplus ends,
+        # measured from the start of the row
+        start = np.cumsum(deficit) - deficit
+        start -= start[np.searchsorted(srow, srow)]
+        end = np.cumsum(surplus)
+        end -= (end - surplus)[np.searchsorted(lrow, lrow)]
+        # find the large entry in the same row whose surplus each
+        # deficit starts in, by shifting each row into its own range
+        j = np.searchsorted(lrow * (n + 1.) + end,
+                            srow * (n + 1.) + start, 'right')
+        j = np.minimum(j, np.searchsorted(lrow, srow, 'right') - 1)
+
+        alias[small] = large[j]
+        q[large] -= np.bincount(j, weights=deficit, minlength=len(large))
+        done = q[large] < 1
+        small = large[done]
+        large = large[~done]
+
+    # whatever is left over (through round-off) is kept for sure
+    q[small] = 1
+    q[large] = 1
+    np.clip(q, 0, 1, out=q)
+    return q.reshape(rows, n), (alias % n).reshape(rows, n)
+
+
+class AliasSampler(object):
+    """Sampler for categorical distributions given by log-weights,
+    using Walker's alias method.  The alias table is built from the
+    normalized weights in O(n), after which every draw costs O(1) (a
+    uniform number, a table lookup and a comparison), however many
+    categories there are.
+
+    Parameters
+    ----------
+    logweights : array-like
+        Unnormalized log-weights of the categories, along the last
+        axis.  If there is more than one axis, each row along the last
+        axis is a separate distribution, and they are all sampled from
+        at once.
+    seed : int (default=0)
+        Seed for the random number generator
+
+    """
+
+    def __init__(self, logweights, seed=0):
+        logweights = np.asarray(logweights)
+        self.shape = logweights.shape[:-1]
+        self.n = logweights.shape[-1]
+        self.seed = seed
+        self.rand = np.random.RandomState(self.seed)
+        logprob = normalize(logweights, axis=-1)[1]
+        prob = np.exp(logprob, out=logprob)
+        prob *= self.n
+        self.prob, self.alias = _alias_table(prob.reshape((-1, self.n)))
+
+    def sample(self, num=1):
+        """Draw category indices.  Returns an array of shape
+        (distributions..., num).
+
+        """
+        rows = self.prob.shape[0]
+        u = self.rand.random_sample((rows, num))
+        u *= self.n
+        k = u.astype(int)
+        # the fractional part decides between k and its alias
+        u -= k
+        # index into the flattened tables, one row per distribution
+        k += (np.arange(rows) * self.n)[:, None]
+        samples = np.where(
+            u < self.prob.ravel()[k],
+            k - (np.arange(rows) * self.n)[:, None],
+            self.alias.ravel()[k])
+        return samples.reshape(self.shape + (num,))
+
+    def __str__(self):
+        """String representation of the AliasSampler"""
+        mytype = type(self).__name__
+        s = "<%s; shape=%s; n=%s>" % (mytype, self.shape, self.n)
+        return s
+
+
+def _resample(logweights, positions):
+    """Indices where the sorted positions (in [0, 1), one row of them
+    per distribution) fall in the cumulative distribution of the
+    weights.
+
+    """
+    logweights = np.asarray(logweights)
+    n = logweights.shape[-1]
+    cdf = np.exp(normalize(logweights, axis=-1)[1])
+    cdf = np.cumsum(cdf.reshape((-1, n)), axis=1)
+    # guard against the last value not quite reaching one
+    cdf[:, -1] = 1
+    rows = np.arange(cdf.shape[0])[:, None]
+    positions = positions.reshape((cdf.shape[0], -1))
+    # search all the rows at once, by shifting row i into [i, i + 1]
+    idx = np.searchsorted((cdf + rows).ravel(), (positions + rows).ravel())
+    idx = idx.reshape(positions.shape) - rows * n
+    return idx.reshape(logweights.shape[:-1] + (-1,))
+
+
+def systematic_resample(logweights, num=None, rand=None):
+    """Systematic resampling of particles with the given log-weights:
+    a single uniform offset u is drawn, and the particles at the
+    positions (u + i) / num of the cumulative distribution, for i = 0
+    ... num - 1, are taken.
+
+    Parameters
+    ----------
+    logweights : array-like
+        Unnormalized log-weights of the particles, along the last axis
+        (other axes are independent sets of particles)
+    num : int (default=None)
+        Number of particles to draw (by default, as many as there are)
+    rand : np.random.RandomState (default=None)
+        Random number generator to use (by default, np.random)
+
+    Returns
+    -------
+    out : np.ndarray
+        Indices of the resampled particles, of shape (sets..., num)
+
+    """
+
+    if rand is None:
+        rand = np.random
+    logweights = np.asarray(logweights)
+    if num is None:
+        num = logweights.shape[-1]
+    u = rand.random_sample(logweights.shape[:-1] + (1,))
+    return _resample(logweights, (u + np.arange(num)) / num)
+
+
+def stratified_resample(logweights, num=None, rand=None):
+    """Stratified resampling of particles with the given log-weights:
+    the cumulative distribution is split into num equal strata, and
+    one particle is taken at a uniformly random position in each.
+
+    Parameters
+    ----------
+    logweights : array-like
+        Unnormalized log-weights of the particles, along the last axis
+        (other axes are independent sets of particles)
+    num : int (default=None)
+        Number of particles to draw (by default, as many as there are)
+    rand : np.random.RandomState (default=None)
+        Random number generator to use (by default, np.random)
+
+    Returns
+    -------
+    out : np.ndarray
+        Indices of the resampled particles, of shape (sets..., num)
+
+    """
+
+    if rand is None:
+        rand = np.random
+    logweights = np.asarray(logweights)
+    if num is None:
+        num = logweights.shape[-1]
+    u = rand.random_sample(logweights.shape[:-1] + (num,))
+    return _resample(logweights, (u + np.arange(num)) / num)
+
+
+class LogNormalizer(object):
+    """Running normalization constant for log-values that arrive in
+    batches (e.g., the log-weights of a particle filter).
+
+    Keeps the running maximum m of the values pushed so far, and the
+    running sum of exp(values - m).  When a batch raises the maximum,
+    the sum is rescaled, so each push costs O(batch size) and nothing
+    is ever exponentiated without first being shifted.  Normalizers
+    that were filled separately can be combined with merge().
+
+    Parameters
+    ----------
     axis : int (default=-1)
-        The axis along which to normalize the values.
-    max_log_value : float (default=709.78)
-        The maximum value that can be exponentiated without causing an
-        overflow exception.
-
-    """
-
-    # shape for the normalization constants (that would otherwise be
-    # missing axis)
-    shape = list(logarr.shape)
-    shape[axis] = 1
-    # get maximum value of array
-    maxlogarr = np.max(logarr, axis=axis).reshape(shape)
-    # calculate how much to shift the array up by
-    shift = (max_log_value - maxlogarr - 2 - logarr.shape[axis])
-    # shift the array
-    unnormed = logarr + shift
-    # convert from logspace
-    arr = np.exp(unnormed)
-    # calculate shifted log normalization constants
-    _lognormconsts = np.log(np.sum(arr, axis=axis)).reshape(shape)
-    # calculate normalized array
-    lognormarr = unnormed - _lognormconsts
-    # unshift normalization constants
-    _lognormconsts -= shift
-    # get rid of the dimension we normalized over
-    lognormconsts = np.sum(_lognormconsts, axis=axis)
-
-    return lognormconsts, lognormarr
+        The axis of each batch along which to normalize.  Apart from
+        along this axis, every batch must have the same shape.
+
+    """
+
+    def __init__(self, axis=-1):
+        self.axis = axis
+        self.m = None
+        self.s = None
+
+    def _add(self, m, s):
+        """Combine a maximum and rescaled sum into the running ones."""
+        if self.m is None:
+            self.m, self.s = m, s
+            return
+        if m.shape != self.m.shape:
+            raise ValueError(
+                "cannot combine shapes %s and %s" % (
+                    m.shape, self.m.shape))
+        self.m, self.s = _combine(self.m, self.s, m, s)
+
+    def push(self, values):
+        """Add a batch of log-values."""
+        values = np.asarray(values)
+        scratch = np.empty(values.shape, dtype=_dtype(values))
+        m, s = _maxsum(values, self.axis, scratch)
+        self._add(np.squeeze(m, axis=self.axis),
+                  np.squeeze(s, axis=self.axis))
+        return self
+
+    def merge(self, other):
+        """Add the values from another LogNormalizer to this one."""
+        if not isinstance(other, LogNormalizer):
+            raise ValueError(
+                "'other' is a %s" % type(other).__name__)
+        if other.m is not None:
+            self._add(other.m, other.s)
+        return self
+
+    @property
+    def lognormconst(self):
+        """The log normalization constant of the values so far"""
+        if self.m is None:
+            raise ValueError("no values have been pushed")
+        with np.errstate(divide='ignore'):
+            lognormconst = np.log(self.s) + self.m
+        return lognormconst[()]
+
+    def normalized(self, values, out=None):
+        """Normalize log-values (e.g., a view of everything pushed so
+        far) by the current normalization constant.
+
+        """
+        lognormconst = np.expand_dims(self.lognormconst, self.axis)
+        return np.subtract(values, lognormconst, out=out)
+
+    def __str__(self):
+        """String representation of the LogNormalizer"""
+        mytype = type(self).__name__
+        s = "<%s; axis=%s>" % (mytype, self.axis)
+        return s
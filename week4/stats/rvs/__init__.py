@@ -3,9 +3,14 @@ Currently includes:
 
     GaussianRV
     StandardNormalRV
+    GaussianRVArray
+    AffineGaussianRV
+    SufficientStats
 
 """
 
-from gaussian import GaussianRV, StandardNormalRV
+from gaussian import (GaussianRV, StandardNormalRV, GaussianRVArray,
+                      AffineGaussianRV, SufficientStats)
 
-__all__ = ['GaussianRV', 'StandardNormalRV']
+__all__ = ['GaussianRV', 'StandardNormalRV', 'GaussianRVArray',
+           'AffineGaussianRV', 'SufficientStats']
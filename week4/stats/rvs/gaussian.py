@@ -1,18 +1,181 @@
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 
+# number of samples drawn from each independent stream when sampling
+# in parallel
+_CHUNKSIZE = 2 ** 20
+
+
+def _fill_chunks(out, key, draw, n_jobs):
+    """Fill 'out' in chunks of _CHUNKSIZE, where chunk i is drawn by
+    draw(rand, size) from its own RandomState seeded with key + [i].
+    Since the streams only depend on the chunk, the result is the same
+    however many threads (n_jobs, or one per CPU if negative) fill it.
+
+    """
+    def fill(i):
+        start = i * _CHUNKSIZE
+        stop = min(start + _CHUNKSIZE, len(out))
+        rand = np.random.RandomState(key + [i])
+        out[start:stop] = draw(rand, stop - start)
+
+    nchunks = -(-len(out) // _CHUNKSIZE)
+    if n_jobs < 0:
+        n_jobs = multiprocessing.cpu_count()
+    n_jobs = min(n_jobs, nchunks)
+    if n_jobs <= 1:
+        for i in range(nchunks):
+            fill(i)
+        return out
+    pool = ThreadPool(n_jobs)
+    try:
+        pool.map(fill, range(nchunks))
+    finally:
+        pool.close()
+    return out
+
+
+def _fuse(mu, var, axis=None):
+    """Mean and variance of the (normalized) product of Gaussians with
+    means 'mu' and variances 'var' along an axis, computed by adding
+    up their precisions and precision-weighted means.
+
+    """
+    prec = 1. / var
+    total = np.sum(prec, axis=axis)
+    new_m = np.sum(mu * prec, axis=axis) / total
+    return new_m, 1. / total
+
+
+def _loglik(stats, mu, var, Z):
+    """Total log-likelihood of the data summarized by 'stats' under
+    Gaussians with means 'mu', variances 'var' and log normalizing
+    constants 'Z', which are broadcast against each other.
+
+    """
+    if not isinstance(stats, SufficientStats):
+        stats = SufficientStats(stats)
+    sqerr = stats.M2 + stats.n * (stats.mean - mu) ** 2
+    return stats.n * Z - sqerr / (2 * var)
+
+
+class SufficientStats(object):
+    """Sufficient statistics of a one-dimensional dataset for a
+    Gaussian likelihood: the number of points 'n', their 'mean', and
+    'M2', the sum of squared deviations from the mean.  (Keeping the
+    centered M2 rather than the raw sum of squares avoids cancellation
+    when the mean is large relative to the spread.)
+
+    Summarizing a dataset is O(n) once; after that GaussianRV.loglik
+    and GaussianRVArray.loglik are O(1) per set of parameters.
+    Statistics of separate chunks of data can be merged with '+'.
+
+    """
+
+    __slots__ = ('n', 'mean', 'M2')
+
+    def __init__(self, vals=()):
+        vals = np.asarray(vals, dtype=float).ravel()
+        self.n = len(vals)
+        if self.n == 0:
+            self.mean = 0.
+            self.M2 = 0.
+        else:
+            self.mean = vals.mean()
+            dev = vals - self.mean
+            self.M2 = np.dot(dev, dev)
+
+    @property
+    def sum(self):
+        """The sum of the data"""
+        return self.n * self.mean
+
+    @property
+    def sumsq(self):
+        """The sum of the squares of the data"""
+        return self.M2 + self.n * self.mean ** 2
+
+    @property
+    def var(self):
+        """The (maximum likelihood) variance of the data"""
+        return self.M2 / self.n
+
+    def update(self, vals):
+        """Add more data to the statistics"""
+        self += SufficientStats(vals)
+        return self
+
+    def __iadd__(self, other):
+        """Merge the statistics of another chunk of data into these,
+        using the pairwise update of Chan et al.:
+
+        https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
+
+        """
+        if not isinstance(other, SufficientStats):
+            raise ValueError("unhandled type: %s" % type(other))
+        n = self.n + other.n
+        if n == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.n / float(n)
+        self.M2 = (self.M2 + other.M2 +
+                   delta ** 2 * self.n * other.n / float(n))
+        self.n = n
+        return self
+
+    def __add__(self, other):
+        """Create new statistics for the union of two datasets"""
+        new_stats = SufficientStats()
+        new_stats += self
+        new_stats += other
+        return new_stats
+
+    def __str__(self):
+        """String representation of the SufficientStats"""
+        mytype = type(self).__name__
+        s = "<%s; n=%s; mean=%s; M2=%s>" % (
+            mytype, self.n, self.mean, self.M2)
+        return s
+
+
 class GaussianRV(object):
     """Gaussian-distributed random variable, parameterized by 'mu'
     (the mean) and 'sigma' (the standard deviation).  Includes methods
     for sampling, evaluation, and transformation (e.g., multiplying
     with another Gaussian).
 
+    The random number generator is only created (from 'seed') the
+    first time it is needed, unless one is passed in as 'rand' (e.g.,
+    to share one stream between many random variables), so creating
+    GaussianRVs -- including through arithmetic -- is cheap.
+
+    For drawing one sample at a time in a tight loop, see set_bufsize
+    and draw.
+
     """
 
-    def __init__(self, mu, sigma, seed=0):
+    __slots__ = ('seed', '_rand', 'mu', 'sigma', '_var', '_Z',
+                 '_bufsize', '_buf', '_bufpos')
+
+    def __init__(self, mu, sigma, seed=0, rand=None):
         self.seed = seed
-        self.rand = np.random.RandomState(self.seed)
-        self.set_mu(mu)
-        self.set_sigma(sigma)
+        self._rand = rand
+        self._bufsize = 0
+        self._buf = []
+        self._bufpos = 0
+        # call these directly, as subclasses may disable them
+        GaussianRV.set_mu(self, mu)
+        GaussianRV.set_sigma(self, sigma)
+
+    @property
+    def rand(self):
+        """The random number generator, created on first use"""
+        if self._rand is None:
+            self._rand = np.random.RandomState(self.seed)
+        return self._rand
 
     def _calc_Z(self):
         """Calculate the constant for the logpdf"""
@@ -28,11 +191,82 @@ class GaussianRV(object):
         self._var = self.sigma ** 2
         self._calc_Z()
 
-    def sample(self, num=1):
-        """Draw samples from the distribution"""
-        samples = self.rand.normal(
-            self.mu, self.sigma, size=num)
-        return samples
+    def set_bufsize(self, bufsize):
+        """Pre-draw standard normal values in blocks of 'bufsize', to
+        be served one at a time by draw() (0 turns this off).  The
+        samples are exactly the same as without the buffer: they are
+        taken from the same stream in the same order, and sample()
+        uses up whatever is left in the buffer first.
+
+        """
+        self._bufsize = bufsize
+
+    def draw(self):
+        """Draw a single sample, as a float.  With a buffer (see
+        set_bufsize), this is much cheaper than sample(1).
+
+        """
+        if self._bufpos == len(self._buf):
+            if not self._bufsize:
+                return float(self.sample(1)[0])
+            # refill the buffer (as a list, as indexing it and doing
+            # arithmetic on Python floats is faster than on NumPy
+            # scalars)
+            self._buf = self.rand.standard_normal(self._bufsize).tolist()
+            self._bufpos = 0
+        z = self._buf[self._bufpos]
+        self._bufpos += 1
+        return self.mu + self.sigma * z
+
+    def sample(self, num=1, n_jobs=None, out=None):
+        """Draw samples from the distribution.
+
+        If n_jobs is given, the samples are drawn in chunks across
+        n_jobs threads (-1 for one per CPU), each chunk from its own
+        child stream, and written into 'out' (a preallocated array of
+        length num) if it is given.  The child streams are keyed by a
+        value drawn from self.rand on every call, so successive calls
+        (and random variables sharing a 'rand') get fresh streams,
+        while a given seed still reproduces the same sequence of
+        calls.  The samples are identical for any n_jobs, but differ
+        from those drawn with n_jobs=None.
+
+        """
+        if n_jobs is None and self._bufpos < len(self._buf):
+            # use up the buffered values first, then continue the
+            # same stream (rand.normal(mu, sigma) is exactly
+            # mu + sigma * rand.standard_normal())
+            # ('num' may be a shape, as for rand.normal)
+            count = int(np.prod(num))
+            z = np.empty(count)
+            take = min(count, len(self._buf) - self._bufpos)
+            z[:take] = self._buf[self._bufpos:self._bufpos + take]
+            self._bufpos += take
+            z[take:] = self.rand.standard_normal(count - take)
+            samples = self.mu + self.sigma * z.reshape(num)
+            if out is not None:
+                out[...] = samples
+                samples = out
+            return samples
+
+        if n_jobs is None:
+            samples = self.rand.normal(
+                self.mu, self.sigma, size=num)
+            if out is not None:
+                out[...] = samples
+                samples = out
+            return samples
+
+        if out is None:
+            out = np.empty(num)
+        # a new key for the child streams of this call
+        key = self.rand.randint(2 ** 31, size=2).tolist()
+        mu = self.mu
+        sigma = self.sigma
+
+        def draw(rand, size):
+            return rand.normal(mu, sigma, size=size)
+        return _fill_chunks(out, key, draw, n_jobs)
 
     def logpdf(self, vals):
         """Evaluate the the logpdf at 'vals'"""
@@ -44,6 +278,14 @@ class GaussianRV(object):
         pdf = np.exp(self.logpdf(vals))
         return pdf
 
+    def loglik(self, stats):
+        """Total log-likelihood of a dataset, i.e. the sum of
+        logpdf(vals), in O(1) from its SufficientStats.  Raw data is
+        summarized first.
+
+        """
+        return _loglik(stats, self.mu, self._var, self._Z)
+
     def plot(self):
         # draw some samples
         samps = self.sample(100000)
@@ -68,12 +310,9 @@ class GaussianRV(object):
         return s
 
     def __add__(self, other):
-        """Create a new GaussianRV with mu=mu+other"""
+        """Create a new (lazy) GaussianRV with mu=mu+other"""
         if isinstance(other, (int, float)):
-            new_rv = GaussianRV(
-                self.mu + other,
-                self.sigma,
-                seed=self.seed)
+            new_rv = AffineGaussianRV(self, 1., other)
         else:
             raise ValueError(
                 "'other' is a %s" % type(other).__name__)
@@ -89,12 +328,9 @@ class GaussianRV(object):
         return self
 
     def __sub__(self, other):
-        """Create a new GaussianRV with mu=mu-other"""
+        """Create a new (lazy) GaussianRV with mu=mu-other"""
         if isinstance(other, (int, float)):
-            new_rv = GaussianRV(
-                self.mu - other,
-                self.sigma,
-                seed=self.seed)
+            new_rv = AffineGaussianRV(self, 1., -other)
         else:
             raise ValueError(
                 "'other' is a %s" % type(other).__name__)
@@ -111,17 +347,14 @@ class GaussianRV(object):
 
     def __mul__(self, other):
         """Create a new GaussianRV, either by multiplying the mean and
-        standard deviation by 'other' or by computing the product of
-        two Gaussians:
+        standard deviation by 'other' (lazily) or by computing the
+        product of two Gaussians:
 
         https://ccrma.stanford.edu/~jos/sasp/Product_Two_Gaussian_PDFs.html
 
         """
         if isinstance(other, (int, float)):
-            new_rv = GaussianRV(
-                self.mu*other,
-                self.sigma*other,
-                seed=self.seed)
+            new_rv = AffineGaussianRV(self, other, 0.)
         elif isinstance(other, GaussianRV):
             m0 = float(self.mu)
             m1 = float(other.mu)
@@ -162,16 +395,42 @@ class GaussianRV(object):
                 "'other' is a %s" % type(other).__name__)
         return self
 
+    @staticmethod
+    def product(rvs):
+        """Create a new GaussianRV that is the product of any number of
+        Gaussians (e.g., fusing several noisy measurements of the
+        same quantity).  This is computed in one pass in precision
+        space, rather than by multiplying them two at a time.
+
+        Parameters
+        ----------
+        rvs : sequence of GaussianRVs, or a GaussianRVArray
+            The Gaussians to multiply together.  The seed of the
+            result is taken from the first one.
+
+        """
+        if isinstance(rvs, GaussianRVArray):
+            mu, var = np.broadcast_arrays(rvs.mu, rvs._var)
+            seed = rvs.seed
+        else:
+            rvs = list(rvs)
+            mu = np.array([rv.mu for rv in rvs], dtype=float)
+            var = np.array([rv._var for rv in rvs], dtype=float)
+            seed = rvs[0].seed
+        new_m, new_v = _fuse(mu, var)
+        new_rv = GaussianRV(
+            float(new_m),
+            float(np.sqrt(new_v)),
+            seed=seed)
+        return new_rv
+
     def __div__(self, other):
-        """Create a new GaussianRV by dividing the mean and variance
-        by 'other'.
+        """Create a new (lazy) GaussianRV by dividing the mean and
+        standard deviation by 'other'.
 
         """
         if isinstance(other, (int, float)):
-            new_rv = GaussianRV(
-                self.mu / other,
-                self.sigma / other,
-                seed=self.seed)
+            new_rv = AffineGaussianRV(self, 1. / other, 0.)
         else:
             raise ValueError(
                 "'other' is a %s" % type(other).__name__)
@@ -187,6 +446,9 @@ class GaussianRV(object):
                 "'other' is a %s" % type(other).__name__)
         return self
 
+    __truediv__ = __div__
+    __itruediv__ = __idiv__
+
 
 class StandardNormalRV(GaussianRV):
     """Standard normal random variable, i.e. zero-mean and unit
@@ -195,11 +457,351 @@ class StandardNormalRV(GaussianRV):
 
     """
 
-    def __init__(self, seed=0):
-        GaussianRV.__init__(self, 0, 1, seed=seed)
-        self.set_mu = None
-        self.set_sigma = None
-        self.__iadd__ = None
-        self.__isub__ = None
-        self.__imul__ = None
-        self.__idiv__ = None
+    __slots__ = ()
+
+    # the parameters cannot be changed
+    set_mu = None
+    set_sigma = None
+    __iadd__ = None
+    __isub__ = None
+    __imul__ = None
+    __idiv__ = None
+    __itruediv__ = None
+
+    def __init__(self, seed=0, rand=None):
+        GaussianRV.__init__(self, 0, 1, seed=seed, rand=rand)
+
+
+class AffineGaussianRV(GaussianRV):
+    """Lazy result of scalar arithmetic on a GaussianRV, i.e. the
+    Gaussian a*X + b, where X has the mean and standard deviation
+    that the original GaussianRV had at the time.
+
+    Further scalar arithmetic just updates (a, b), so a chain like
+    (rv * 2 + 3 - 1) / 4 creates a few small objects but never
+    computes a normalizing constant or creates a random number
+    generator.  A concrete GaussianRV (with the same seed as the
+    original) is only built when the node is sampled or evaluated.
+
+    """
+
+    __slots__ = ('_mu0', '_sigma0', '_seed', '_a', '_b', '_rv')
+
+    def __init__(self, rv, a, b):
+        if isinstance(rv, AffineGaussianRV):
+            # fold a*(a0*X + b0) + b into a single transform
+            self._mu0 = rv._mu0
+            self._sigma0 = rv._sigma0
+            self._seed = rv._seed
+            self._a = a * rv._a
+            self._b = a * rv._b + b
+        else:
+            self._mu0 = rv.mu
+            self._sigma0 = rv.sigma
+            self._seed = rv.seed
+            self._a = a
+            self._b = b
+        self._rand = None
+        self._rv = None
+
+    @property
+    def seed(self):
+        """The seed of the original GaussianRV"""
+        return self._seed
+
+    @property
+    def rand(self):
+        """The random number generator of the concrete GaussianRV"""
+        return self._materialize().rand
+
+    @property
+    def mu(self):
+        """The mean, a*mu0 + b"""
+        return self._a * self._mu0 + self._b
+
+    @property
+    def sigma(self):
+        """The standard deviation, a*sigma0"""
+        return self._a * self._sigma0
+
+    @property
+    def _var(self):
+        """The variance"""
+        return self.sigma ** 2
+
+    @property
+    def _Z(self):
+        """The constant for the logpdf"""
+        return -0.5 * np.log(2 * np.pi * self._var)
+
+    def _materialize(self):
+        """The concrete GaussianRV, built on first use"""
+        if self._rv is None:
+            self._rv = GaussianRV(self.mu, self.sigma, seed=self._seed)
+        return self._rv
+
+    def _update(self):
+        """Pass new parameters on to the concrete GaussianRV, if there
+        is one, so that it carries on with the same random stream (and
+        buffer) rather than starting over.
+
+        """
+        if self._rv is not None:
+            GaussianRV.set_mu(self._rv, self.mu)
+            GaussianRV.set_sigma(self._rv, self.sigma)
+
+    def set_mu(self, mu):
+        """Set the value of mu"""
+        self._b = mu - self._a * self._mu0
+        self._update()
+
+    def set_sigma(self, sigma):
+        """Set the value of sigma (keeping mu the same)"""
+        mu = self.mu
+        self._a = sigma / float(self._sigma0)
+        self._b = mu - self._a * self._mu0
+        self._update()
+
+    def set_bufsize(self, bufsize):
+        """Set the buffer size of the concrete GaussianRV"""
+        self._materialize().set_bufsize(bufsize)
+
+    def draw(self):
+        """Draw a single sample from the concrete GaussianRV"""
+        return self._materialize().draw()
+
+    def sample(self, num=1, n_jobs=None, out=None):
+        """Draw samples from the concrete GaussianRV"""
+        return self._materialize().sample(num, n_jobs=n_jobs, out=out)
+
+    def logpdf(self, vals):
+        """Evaluate the logpdf of the concrete GaussianRV at 'vals'"""
+        return self._materialize().logpdf(vals)
+
+    def pdf(self, vals):
+        """Evaluate the pdf of the concrete GaussianRV at 'vals'"""
+        return self._materialize().pdf(vals)
+
+
+class GaussianRVArray(object):
+    """Array of independent Gaussian-distributed random variables,
+    parameterized by arrays 'mu' (the means) and 'sigma' (the standard
+    deviations), which are broadcast against each other.  Supports
+    the same methods as GaussianRV (sampling, evaluation, and
+    transformation), each of which works on the whole array at once.
+
+    Unlike an array of GaussianRV objects, the parameters are stored
+    as a few NumPy arrays and share a single random number generator,
+    so millions of distributions are cheap to hold and to evaluate.
+
+    """
+
+    def __init__(self, mu, sigma, seed=0):
+        self.seed = seed
+        self.rand = np.random.RandomState(self.seed)
+        mu, sigma = np.broadcast_arrays(
+            np.asarray(mu, dtype=float), np.asarray(sigma, dtype=float))
+        self.set_mu(mu)
+        self.set_sigma(sigma)
+
+    def _calc_Z(self):
+        """Calculate the constants for the logpdf"""
+        self._Z = -0.5 * np.log(2 * np.pi * self._var)
+
+    def set_mu(self, mu):
+        """Set the values of mu"""
+        self.mu = np.array(mu, dtype=float)
+    def set_sigma(self, sigma):
+        """Set the values of sigma"""
+        self.sigma = np.array(sigma, dtype=float)
+        # Also calculate the variances and the Z constants
+        self._var = self.sigma ** 2
+        self._calc_Z()
+
+    @property
+    def shape(self):
+        """The shape of the array of random variables"""
+        return np.broadcast(self.mu, self.sigma).shape
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, index):
+        """Select some of the random variables, as a new
+        GaussianRVArray
+
+        """
+        mu, sigma = np.broadcast_arrays(self.mu, self.sigma)
+        return GaussianRVArray(mu[index], sigma[index], seed=self.seed)
+
+    def sample(self, num=1):
+        """Draw samples from every distribution.  Returns an array of
+        shape (num,) + self.shape.
+
+        """
+        samples = self.rand.normal(
+            self.mu, self.sigma, size=(num,) + self.shape)
+        return samples
+
+    def logpdf(self, vals):
+        """Evaluate the logpdfs at 'vals', which is broadcast against
+        the parameters
+
+        """
+        logpdf = self._Z - (((vals - self.mu) ** 2) / (2 * self._var))
+        return logpdf
+
+    def pdf(self, vals):
+        """Evaluate the pdfs at 'vals', which is broadcast against the
+        parameters
+
+        """
+        pdf = np.exp(self.logpdf(vals))
+        return pdf
+
+    def loglik(self, stats):
+        """Total log-likelihood of one dataset under each of the
+        distributions, as an array of shape self.shape.  This makes a
+        whole grid of parameters (e.g. GaussianRVArray(mu[:, None],
+        sigma[None, :])) cost O(1) per point after summarizing the data
+        once into SufficientStats.  Raw data is summarized first.
+
+        """
+        loglik = _loglik(stats, self.mu, self._var, self._Z)
+        return loglik
+
+    def __str__(self):
+        """String representation of the GaussianRVArray"""
+        mytype = type(self).__name__
+        s = "<%s; shape=%s>" % (mytype, self.shape)
+        return s
+
+    def product(self, axis=-1):
+        """Create a new GaussianRVArray by multiplying together the
+        Gaussians along an axis, e.g. fusing many independent groups
+        of measurements (one group per row) at once.  This is computed
+        in precision space in one vectorized pass.
+
+        """
+        mu, var = np.broadcast_arrays(self.mu, self._var)
+        new_m, new_v = _fuse(mu, var, axis=axis)
+        new_rv = GaussianRVArray(new_m, np.sqrt(new_v), seed=self.seed)
+        return new_rv
+
+    def _params(self, other):
+        """The means and variances of 'other', if it is a Gaussian
+        random variable (or an array of them), else None
+
+        """
+        if isinstance(other, (GaussianRV, GaussianRVArray)):
+            return other.mu, other._var
+        return None
+
+    def _check(self, other):
+        """Raise an error if 'other' is not a number or array"""
+        if not isinstance(other, (int, float, np.number, np.ndarray)):
+            raise ValueError(
+                "'other' is a %s" % type(other).__name__)
+
+    def __add__(self, other):
+        """Create a new GaussianRVArray with mu=mu+other"""
+        self._check(other)
+        new_rv = GaussianRVArray(
+            self.mu + other,
+            self.sigma,
+            seed=self.seed)
+        return new_rv
+
+    def __iadd__(self, other):
+        """Shift mu=mu+other"""
+        self._check(other)
+        self.set_mu(self.mu + other)
+        return self
+
+    def __sub__(self, other):
+        """Create a new GaussianRVArray with mu=mu-other"""
+        self._check(other)
+        new_rv = GaussianRVArray(
+            self.mu - other,
+            self.sigma,
+            seed=self.seed)
+        return new_rv
+
+    def __isub__(self, other):
+        """Shift mu=mu-other"""
+        self._check(other)
+        self.set_mu(self.mu - other)
+        return self
+
+    def _product(self, other):
+        """Means and standard deviations of the products of these
+        Gaussians with the Gaussian(s) in 'other'
+
+        """
+        m1, v1 = self._params(other)
+        m0 = self.mu
+        v0 = self._var
+        new_m = (m0 * v1 + m1 * v0) / (v0 + v1)
+        new_v = v0 * v1 / (v0 + v1)
+        return new_m, np.sqrt(new_v)
+
+    def __mul__(self, other):
+        """Create a new GaussianRVArray, either by multiplying the
+        means and standard deviations by 'other' or by computing the
+        products with the Gaussian(s) in 'other' (a GaussianRV or a
+        GaussianRVArray), elementwise:
+
+        https://ccrma.stanford.edu/~jos/sasp/Product_Two_Gaussian_PDFs.html
+
+        """
+        if self._params(other) is not None:
+            new_m, new_s = self._product(other)
+        else:
+            self._check(other)
+            new_m = self.mu * other
+            new_s = self.sigma * other
+        new_rv = GaussianRVArray(new_m, new_s, seed=self.seed)
+        return new_rv
+
+    def __imul__(self, other):
+        """Multiply the means and standard deviations by 'other' or
+        compute the products with the Gaussian(s) in 'other',
+        elementwise:
+
+        https://ccrma.stanford.edu/~jos/sasp/Product_Two_Gaussian_PDFs.html
+
+        """
+        if self._params(other) is not None:
+            new_m, new_s = self._product(other)
+        else:
+            self._check(other)
+            new_m = self.mu * other
+            new_s = self.sigma * other
+        new_m, new_s = np.broadcast_arrays(new_m, new_s)
+        self.set_mu(new_m)
+        self.set_sigma(new_s)
+        return self
+
+    def __div__(self, other):
+        """Create a new GaussianRVArray by dividing the means and
+        standard deviations by 'other'.
+
+        """
+        self._check(other)
+        new_rv = GaussianRVArray(
+            self.mu / other,
+            self.sigma / other,
+            seed=self.seed)
+        return new_rv
+
+    def __idiv__(self, other):
+        """Divide the means and standard deviations by 'other'."""
+        self._check(other)
+        new_m, new_s = np.broadcast_arrays(
+            self.mu / other, self.sigma / other)
+        self.set_mu(new_m)
+        self.set_sigma(new_s)
+        return self
+
+    __truediv__ = __div__
+    __itruediv__ = __idiv__